@@ -18,11 +18,47 @@ import sgtk
 class TkArnoldNodeApp(sgtk.platform.Application):
     """The Arnold Output Node."""
 
+    # the base class still provides an instance __dict__, but slots give the
+    # attributes below fixed offsets instead of dict lookups.
+    __slots__ = (
+        "_handler_cls",
+        "_handler",
+        "_work_file_template",
+        "_handler_methods",
+        "_log_debug",
+    )
+
+    _HANDLER_DISPATCH = {
+        "convert_to_regular": "convert_to_regular_arnold_nodes",
+        "convert_back": "convert_back_to_tk_arnold_nodes",
+        "get_all_nodes": "get_all_tk_arnold_nodes",
+        "get_output_path": "get_output_path",
+    }
+    """Maps app operations to the handler classmethods implementing them."""
+
     def init_app(self):
         """Initialize the app."""
 
-        tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
-        self.handler = tk_houdini_arnold.TkArnoldNodeHandler(self)
+        # bind the debug logging method once for the frequently called methods
+        self._log_debug = self.logger.debug
+
+        # the handler module is imported on first use so that houdini
+        # sessions which never touch an arnold node don't pay for it.
+        self._handler_cls = None
+        self._handler = None
+        self._handler_methods = None
+
+        # app settings don't change during a session, so resolve the work
+        # file template once.
+        self._work_file_template = self.get_template("work_file_template")
+
+    @property
+    def handler(self):
+        """The Tk Arnold node handler, created on first access."""
+
+        if self._handler is None:
+            self._handler = self._get_handler_cls()(self)
+        return self._handler
 
     def convert_to_regular_arnold_nodes(self):
         """Convert Toolkit Arnold nodes to regular Arnold nodes.
@@ -40,11 +76,9 @@ class TkArnoldNodeApp(sgtk.platform.Application):
 
         """
 
-        self.log_debug(
+        self._log_debug(
             "Converting Toolkit Arnold nodes to built-in Arnold nodes.")
-        tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
-        tk_houdini_arnold.TkArnoldNodeHandler.\
-            convert_to_regular_arnold_nodes(self)
+        self._get_handler_method("convert_to_regular")(self)
 
     def convert_back_to_tk_arnold_nodes(self):
         """Convert regular Arnold nodes back to Toolkit Arnold nodes.
@@ -61,15 +95,13 @@ class TkArnoldNodeApp(sgtk.platform.Application):
 
         """
 
-        self.log_debug(
+        self._log_debug(
             "Converting built-in Arnold nodes back to Toolkit Arnold nodes.")
-        tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
-        tk_houdini_arnold.TkArnoldNodeHandler.\
-            convert_back_to_tk_arnold_nodes(self)
+        self._get_handler_method("convert_back")(self)
 
     def get_nodes(self):
         """
-        Returns a list of hou.node objects for each tk arnold node.
+        Returns a tuple of hou.node objects for each tk arnold node.
 
         Example usage::
 
@@ -79,13 +111,30 @@ class TkArnoldNodeApp(sgtk.platform.Application):
         >>> tk_arnold_nodes = app.get_nodes()
         """
 
-        self.log_debug("Retrieving tk-houdini-arnold nodes...")
-        tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
-        nodes = tk_houdini_arnold.TkarnoldNodeHandler.\
-            get_all_tk_arnold_nodes()
-        self.log_debug("Found %s tk-houdini-arnold nodes." % (len(nodes),))
+        self._log_debug("Retrieving tk-houdini-arnold nodes...")
+        nodes = tuple(self._get_handler_method("get_all_nodes")())
+        self._log_debug("Found %s tk-houdini-arnold nodes.", len(nodes))
         return nodes
 
+    def iter_nodes(self):
+        """
+        Yields a hou.node object for each tk arnold node.
+
+        Use this instead of get_nodes() when the nodes only need to be
+        iterated over.
+
+        Example usage::
+
+        >>> import sgtk
+        >>> eng = sgtk.platform.current_engine()
+        >>> app = eng.apps["tk-houdini-arnoldnode"]
+        >>> for tk_arnold_node in app.iter_nodes():
+        ...     print(tk_arnold_node.path())
+        """
+
+        for node in self._get_handler_method("get_all_nodes")():
+            yield node
+
     def get_output_path(self, node):
         """
         Returns the evaluated output path for the supplied node.
@@ -98,16 +147,68 @@ class TkArnoldNodeApp(sgtk.platform.Application):
         >>> output_path = app.get_output_path(tk_arnold_node)
         """
 
-        self.log_debug("Retrieving output path for %s" % (node,))
-        tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
-        output_path = tk_houdini_arnold.TkArnoldNodeHandler.\
-            get_output_path(node)
-        self.log_debug("Retrieved output path: %s" % (output_path,))
+        # let the logger do the formatting so that it is skipped entirely
+        # when debug logging is disabled.
+        self._log_debug("Retrieving output path for %s", node)
+        output_path = self._get_handler_method("get_output_path")(node)
+        self._log_debug("Retrieved output path: %s", output_path)
         return output_path
 
+    def get_output_paths(self, nodes):
+        """
+        Returns a dictionary mapping each supplied node to its evaluated
+        output path.
+
+        Prefer this over calling get_output_path() in a loop when querying
+        many nodes.
+
+        Example usage::
+
+        >>> import sgtk
+        >>> eng = sgtk.platform.current_engine()
+        >>> app = eng.apps["tk-houdini-arnoldnode"]
+        >>> output_paths = app.get_output_paths(app.get_nodes())
+        """
+
+        get_output_path = self._get_handler_method("get_output_path")
+        output_paths = dict((node, get_output_path(node)) for node in nodes)
+        self._log_debug(
+            "Retrieved %s output paths.", len(output_paths))
+        return output_paths
+
     def get_work_file_template(self):
         """
         Returns the configured work file template for the app.
         """
 
-        return self.get_template("work_file_template")
\ No newline at end of file
+        return self._work_file_template
+
+    def _get_handler_cls(self):
+        """
+        Returns the handler class, importing the handler module if needed.
+        """
+
+        # import_module sets up the app's python path and registers the module
+        # with the engine, which only needs to happen once. Afterwards, the
+        # cached handler class is used directly. sys.modules is deliberately
+        # not consulted: the bare module name isn't guaranteed to belong to
+        # this app instance when several environments are loaded.
+        if self._handler_cls is None:
+            tk_houdini_arnold = self.import_module("tk_houdini_arnoldnode")
+            self._handler_cls = tk_houdini_arnold.TkArnoldNodeHandler
+        return self._handler_cls
+
+    def _get_handler_method(self, name):
+        """
+        Returns the handler classmethod registered for the supplied operation.
+
+        :param str name: A key of _HANDLER_DISPATCH.
+        """
+
+        if self._handler_methods is None:
+            handler_cls = self._get_handler_cls()
+            self._handler_methods = dict(
+                (key, getattr(handler_cls, method_name))
+                for (key, method_name) in self._HANDLER_DISPATCH.items()
+            )
+        return self._handler_methods[name]
\ No newline at end of file
@@ -9,10 +9,12 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 # built-ins
+import collections
 import os
 import sys
 import re
 import shutil
+import subprocess
 
 # houdini
 import hou
@@ -21,6 +23,69 @@ import hou
 import sgtk
 
 
+# matches the plane number at the end of a multiparm instance name
+_PLANE_NUMBER_REGEX = re.compile(r"(\d+)$")
+
+# names of the parms belonging to an aov plane. template_mapping holds the
+# plane's (parm name, template name) pairs from TK_EXTRA_PLANE_TEMPLATE_MAPPING
+_PlaneParmNames = collections.namedtuple("_PlaneParmNames", [
+    "label",
+    "enable",
+    "separate",
+    "separate_file",
+    "ar_separate_file",
+    "template_mapping",
+])
+
+# aov plane parm names keyed by plane number. see _get_plane_parm_names
+_PLANE_PARM_NAMES = {}
+
+# static items following the toolkit path in the output path menu
+_OUTPUT_PATH_MENU_TAIL = (
+    "ip", "mplay (interactive)",
+    "md", "mplay (non-interactive)",
+)
+
+
+def _get_open_dir_function():
+    """Return a callable opening a directory in the platform's file browser.
+
+    Returns None if the current platform is not supported.
+
+    """
+
+    if sys.platform == "win32":
+        return os.startfile
+
+    program = {
+        "linux": "xdg-open",
+        "linux2": "xdg-open",
+        "darwin": "open",
+    }.get(sys.platform)
+
+    if program is None:
+        return None
+
+    def open_dir(path):
+        # run the program directly rather than through a shell, so the path
+        # doesn't need quoting
+        exit_code = subprocess.call([program, path])
+        if exit_code != 0:
+            raise OSError("'%s' exited with code %s" % (program, exit_code))
+
+    return open_dir
+
+
+# opens a directory in the file browser on this platform, or None
+_open_dir = _get_open_dir_function()
+
+# lazy range on python 2 and 3
+try:
+    _range = xrange
+except NameError:
+    _range = range
+
+
 class TkArnoldNodeHandler(object):
     """Handle Tk Arnold node operations and callbacks."""
 
@@ -104,9 +169,13 @@ class TkArnoldNodeHandler(object):
             hou.ropNodeTypeCategory(), cls.HOU_ARNOLD_NODE_TYPE).instances()
 
         if not arnold_nodes:
-            app.log_debug("No Arnold Nodes found for conversion.")
+            app.logger.debug("No Arnold Nodes found for conversion.")
             return
         
+        # output profile menu index by label. every tk arnold node has the
+        # same menu, so this is built from the first node created.
+        output_profile_indices = None
+
         # iterate over all the arnold nodes and attempt to convert them
         for arnold_node in arnold_nodes:
 
@@ -131,23 +200,28 @@ class TkArnoldNodeHandler(object):
 
             # find the index of the stored name on the new tk arnold node
             # and set that item in the menu.
-            try:
-                output_profile_parm = tk_arnold_node.parm(
-                    TkArnoldNodeHandler.TK_OUTPUT_PROFILE_PARM)
-                output_profile_index = output_profile_parm.menuLabels().index(
-                    tk_output_profile_name)
-                output_profile_parm.set(output_profile_index)
-            except ValueError:
+            output_profile_parm = tk_arnold_node.parm(
+                TkArnoldNodeHandler.TK_OUTPUT_PROFILE_PARM)
+            if output_profile_indices is None:
+                output_profile_indices = dict(
+                    (label, index) for (index, label) in
+                    enumerate(output_profile_parm.menuLabels())
+                )
+            output_profile_index = output_profile_indices.get(
+                tk_output_profile_name)
+            if output_profile_index is None:
                 app.log_warning("No output profile found named: %s" % 
                     (tk_output_profile_name,))
+            else:
+                output_profile_parm.set(output_profile_index)
 
             # copy over all parameter values except the output path 
             _copy_parm_values(arnold_node, tk_arnold_node, excludes=[])
 
             # explicitly copy AOV settings to the new tk arnold node
-            plane_numbers = _get_extra_plane_numbers(arnold_node)
-            for plane_number in plane_numbers:
-                plane_parm_name = cls.TK_EXTRA_PLANES_NAME % (plane_number,)
+            plane_count = _get_extra_plane_count(arnold_node)
+            for plane_number in _iter_extra_plane_numbers(plane_count):
+                plane_parm_name = _get_plane_parm_names(plane_number).label
                 aov_name = user_dict.get(plane_parm_name)
                 tk_arnold_node.parm(plane_parm_name).set(aov_name)
 
@@ -167,8 +241,8 @@ class TkArnoldNodeHandler(object):
             tk_arnold_node.setName(arnold_node_name)
             tk_arnold_node.setPosition(arnold_node_pos)
 
-            app.log_debug("Converted: Arnold node '%s' to TK Arnold node."
-                % (arnold_node_name,))
+            app.logger.debug("Converted: Arnold node '%s' to TK Arnold node.",
+                arnold_node_name)
 
     @classmethod
     def convert_to_regular_arnold_nodes(cls, app):
@@ -184,7 +258,7 @@ class TkArnoldNodeHandler(object):
             hou.ropNodeTypeCategory(), tk_node_type).instances()
 
         if not tk_arnold_nodes:
-            app.log_debug("No Toolkit Arnold Nodes found for conversion.")
+            app.logger.debug("No Toolkit Arnold Nodes found for conversion.")
             return
 
         for tk_arnold_node in tk_arnold_nodes:
@@ -193,11 +267,9 @@ class TkArnoldNodeHandler(object):
             arnold_node = tk_arnold_node.parent().createNode(
                 cls.HOU_ARNOLD_NODE_TYPE)
 
-            # copy across knob values
-            exclude_parms = [parm for parm in tk_arnold_node.parms() 
-                if parm.name().startswith("sgtk_")]
+            # copy across knob values, skipping the toolkit specific parms
             _copy_parm_values(tk_arnold_node, arnold_node,
-                excludes=exclude_parms)
+                exclude_predicate=lambda name: name.startswith("sgtk_"))
 
             # store the arnold output profile name in the user data so that we
             # can retrieve it later.
@@ -209,9 +281,9 @@ class TkArnoldNodeHandler(object):
                 tk_output_profile_name)
 
             # store AOV info on the new node
-            plane_numbers = _get_extra_plane_numbers(tk_arnold_node)
-            for plane_number in plane_numbers:
-                plane_parm_name = cls.TK_EXTRA_PLANES_NAME % (plane_number,)
+            plane_count = _get_extra_plane_count(tk_arnold_node)
+            for plane_number in _iter_extra_plane_numbers(plane_count):
+                plane_parm_name = _get_plane_parm_names(plane_number).label
                 arnold_node.setUserData(plane_parm_name,
                     tk_arnold_node.parm(plane_parm_name).eval())
 
@@ -231,13 +303,13 @@ class TkArnoldNodeHandler(object):
             arnold_node.setName(tk_arnold_node_name)
             arnold_node.setPosition(tk_arnold_node_pos)
 
-            app.log_debug("Converted: Tk Arnold node '%s' to Arnold node."
-                % (tk_arnold_node_name,))
+            app.logger.debug("Converted: Tk Arnold node '%s' to Arnold node.",
+                tk_arnold_node_name)
 
     @classmethod
     def get_all_tk_arnold_nodes(cls):
         """
-        Returns a list of all tk-houdini-arnoldnode instances in the current
+        Returns a tuple of all tk-houdini-arnoldnode instances in the current
         session.
         """
 
@@ -270,6 +342,7 @@ class TkArnoldNodeHandler(object):
 
         # get and cache the list of profiles defined in the settings
         self._output_profiles = {}
+        self._output_profile_templates = {}
         for output_profile in self._app.get_setting("output_profiles", []):
             output_profile_name = output_profile["name"]
 
@@ -282,8 +355,32 @@ class TkArnoldNodeHandler(object):
                 continue
 
             self._output_profiles[output_profile_name] = output_profile
-            self._app.log_debug("Caching arnold output profile: '%s'" % 
-                (output_profile_name,))
+            self._app.logger.debug("Caching arnold output profile: '%s'",
+                output_profile_name)
+
+            # resolve the profile's templates up front as they never change
+            self._output_profile_templates[output_profile_name] = dict(
+                (key, self._app.get_template_by_name(value))
+                for (key, value) in output_profile.items()
+                if key.endswith("_template")
+            )
+
+        # the output profile menu lists the profiles in this order, so the
+        # menu index can be used to look up the profile directly.
+        self._output_profile_names = list(self._output_profiles)
+        self._output_profiles_by_index = [
+            self._output_profiles[output_profile_name]
+            for output_profile_name in self._output_profile_names
+        ]
+
+        # the last hip file fields computed, keyed by hip path and profile name
+        self._hipfile_fields_cache = (None, None)
+
+        # profiles don't change after init, so build the menu items once
+        self._output_profile_menu_labels = tuple(
+            item for pair in enumerate(self._output_profile_names)
+            for item in pair
+        )
 
 
     ############################################################################
@@ -298,17 +395,13 @@ class TkArnoldNodeHandler(object):
         from sgtk.platform.qt import QtGui
         QtGui.QApplication.clipboard().setText(render_path)
 
-        self._app.log_debug(
-            "Copied render path to clipboard: %s" % (render_path,))
+        self._app.logger.debug(
+            "Copied render path to clipboard: %s", render_path)
 
     def get_output_profile_menu_labels(self):
         """Returns labels for all tk-houdini-arnoldnode output profiles."""
 
-        menu_labels = []
-        for count, output_profile_name in enumerate(self._output_profiles):
-            menu_labels.extend([count, output_profile_name])
-
-        return menu_labels
+        return self._output_profile_menu_labels
 
 
     def get_output_path_menu(self, node=None):
@@ -321,33 +414,33 @@ class TkArnoldNodeHandler(object):
         
         """
 
-        if not None:
+        if node is None:
             node = hou.pwd()
 
         # is this the first time this has been created?
         is_first_run = (node.parm(self.TK_INIT_PARM_NAME).eval() == "True")
         if is_first_run:
             # set it to false for subsequent calls
-            node.parm(is_first_run).set("False")
+            node.parm(self.TK_INIT_PARM_NAME).set("False")
 
         # see if the hip file has changed
+        hip_path = hou.hipFile.path()
         hip_path_changed = (
-            hou.hipFile.path() != node.parm(self.TK_HIP_PATH_PARM_NAME).eval())
+            hip_path != node.parm(self.TK_HIP_PATH_PARM_NAME).eval())
 
         if is_first_run or hip_path_changed:
             # make sure node is in default state.
             self.reset_render_path(node)
 
             # cache current hip file path to compare against later
-            node.parm(self.TK_HIP_PATH_PARM_NAME).set(hou.hipFile.path())
+            node.parm(self.TK_HIP_PATH_PARM_NAME).set(hip_path)
 
         # get path from hidden parameter which acts like a cache.
         path = node.parm(self.NODE_OUTPUT_PATH_PARM).unexpandedString()
 
         # Build the menu
-        menu = ["sgtk", path,
-                "ip", "mplay (interactive)",
-                "md", "mplay (non-interactive)"]
+        menu = ["sgtk", path]
+        menu.extend(_OUTPUT_PATH_MENU_TAIL)
 
         return menu
 
@@ -373,24 +466,21 @@ class TkArnoldNodeHandler(object):
             self._compute_and_set(node, parm_name, template_name)
 
         # Extra Image Planes / AOVs
-        plane_numbers = _get_extra_plane_numbers(node)
-        for plane_number in plane_numbers:
-            usefile_parm = node.parm("ar_aov_separate%s" % (plane_number,)) 
+        plane_count = _get_extra_plane_count(node)
+        for plane_number in _iter_extra_plane_numbers(plane_count):
+            plane_parm_names = _get_plane_parm_names(plane_number)
 
             # only compute the template path if plane is using a different file
-            if usefile_parm.eval():
+            if node.parm(plane_parm_names.separate).eval():
+                aov_name = node.parm(plane_parm_names.label).eval()
                 for (parm_name, template_name) in \
-                    self.TK_EXTRA_PLANE_TEMPLATE_MAPPING.items():
-                    parm_name = parm_name.replace("#", str(plane_number))
-                    aov_name = node.parm(
-                        self.TK_EXTRA_PLANES_NAME % (plane_number,)).eval()
+                    plane_parm_names.template_mapping:
                     self._compute_and_set(node, parm_name, template_name,
                         aov_name)
 
         # set the output paths
         path = node.parm(self.NODE_OUTPUT_PATH_PARM).unexpandedString()
-        node.parm("sgtk_ar_picture").set(path)
-        node.parm("ar_picture").set(path)
+        node.setParms({"sgtk_ar_picture": path, "ar_picture": path})
 
         self.update_parms(node)
 
@@ -409,8 +499,8 @@ class TkArnoldNodeHandler(object):
 
         output_profile = self._get_output_profile(node)
 
-        self._app.log_debug("Applying tk arnold node profile: %s" % 
-            (output_profile["name"],))
+        self._app.logger.debug("Applying tk arnold node profile: %s",
+            output_profile["name"])
 
         # reset some parameters if need be
         if reset:
@@ -424,7 +514,7 @@ class TkArnoldNodeHandler(object):
         # apply the supplied settings to the node
         settings = output_profile["settings"]
         if settings:
-            self._app.log_debug("Populating format settings: %s" % (settings,))
+            self._app.logger.debug("Populating format settings: %s", settings)
             node.setParms(settings)
 
         self.reset_render_path(node)
@@ -469,24 +559,18 @@ class TkArnoldNodeHandler(object):
         # if we have a valid render path then show it:
         if render_dir:
             # TODO: move to utility method in core
-            system = sys.platform
-
-            # run the app
-            if system == "linux2":
-                cmd = "xdg-open \"%s\"" % render_dir
-            elif system == "darwin":
-                cmd = "open '%s'" % render_dir
-            elif system == "win32":
-                cmd = "cmd.exe /C start \"Folder\" \"%s\"" % render_dir
-            else:
-                msg = "Platform '%s' is not supported." % (system,)
+            if _open_dir is None:
+                msg = "Platform '%s' is not supported." % (sys.platform,)
                 self._app.log_error(msg)
                 hou.ui.displayMessage(msg)
+                return
 
-            self._app.log_debug("Executing command:\n '%s'" % (cmd,))
-            exit_code = os.system(cmd)
-            if exit_code != 0:
-                msg = "Failed to launch '%s'!" % (cmd,)
+            self._app.logger.debug("Opening directory:\n '%s'", render_dir)
+            try:
+                _open_dir(render_dir)
+            except OSError as err:
+                msg = "Failed to open '%s': %s" % (render_dir, err)
+                self._app.log_error(msg)
                 hou.ui.displayMessage(msg)
 
     def setup_node(self, node):
@@ -522,20 +606,21 @@ class TkArnoldNodeHandler(object):
         if not node:
             node = hou.pwd()
 
-        # copies the value of one parm to another
-        copy_parm = lambda p1, p2: \
-            node.parm(p2).set(node.parm(p1).unexpandedString())
-
-        # copy the default udpate parms
-        for parm1, parm2 in self.TK_DEFAULT_UPDATE_PARM_MAPPING.items():
-            copy_parm(parm1, parm2)
-
-        # handle additional planes
-        plane_numbers = _get_extra_plane_numbers(node)
-        for plane_number in plane_numbers:
-            parm1 = "sgtk_ar_aov_separate_file" + str(plane_number)
-            parm2 = "ar_aov_separate_file" + str(plane_number)
-            copy_parm(parm1, parm2)
+        # the default update parms plus the additional planes
+        parm_mapping = dict(self.TK_DEFAULT_UPDATE_PARM_MAPPING)
+        plane_count = _get_extra_plane_count(node)
+        for plane_number in _iter_extra_plane_numbers(plane_count):
+            plane_parm_names = _get_plane_parm_names(plane_number)
+            parm_mapping[plane_parm_names.separate_file] = \
+                plane_parm_names.ar_separate_file
+
+        # fetch all the source parms with a single call and copy their values
+        # to the target parms in one go
+        source_parms = node.globParms(" ".join(parm_mapping))
+        node.setParms(dict(
+            (parm_mapping[parm.name()], parm.unexpandedString())
+            for parm in source_parms
+        ))
     
     def use_file_plane(self, **kwargs):
         """Callback for "Different File" checkbox on every Extra Image Plane.
@@ -553,12 +638,13 @@ class TkArnoldNodeHandler(object):
         parm = kwargs["parm"]
     
         # replace the parm basename with nothing, leaving the plane number
-        plane_number = re.findall(r'\d+', parm.name())[-1]
+        plane_number = int(_PLANE_NUMBER_REGEX.search(parm.name()).group(1))
+        plane_parm_names = _get_plane_parm_names(plane_number)
         
-        if node.parm('ar_aov_separate{}'.format(plane_number)).eval():
+        if node.parm(plane_parm_names.separate).eval():
             self.reset_render_path(node)
         else:
-            path_parm = node.parm("sgtk_ar_aov_separate_file%s" % (plane_number,))
+            path_parm = node.parm(plane_parm_names.separate_file)
             path_parm.lock(False)
             path_parm.set("Disabled")
             path_parm.lock(True)
@@ -576,7 +662,7 @@ class TkArnoldNodeHandler(object):
         hou.hipFile.save(file_name=None, save_to_recent_files=True)
 
         shutil.copy2(hou.hipFile.path(), backup_path)
-        self._app.log_debug("Created backup file for %s" % node.name())
+        self._app.logger.debug("Created backup file for %s", node.name())
 
 
     def get_backup_file(self, node):
@@ -621,11 +707,12 @@ class TkArnoldNodeHandler(object):
             # Publish render passes
             for parm in node.parm('ar_aovs').multiParmInstances():
                 if 'sgtk_ar_aov_separate_file' in parm.name():
-                    index = re.findall(r'\d+', parm.name())[-1]
+                    index = int(_PLANE_NUMBER_REGEX.search(parm.name()).group(1))
+                    plane_parm_names = _get_plane_parm_names(index)
 
-                    if node.parm('ar_enable_aov{}'.format(index)).evalAsInt() \
-                        and node.parm('ar_aov_label{}'.format(index)).evalAsString()\
-                        and node.parm('ar_aov_separate{}'.format(index)).evalAsInt():
+                    if node.parm(plane_parm_names.enable).evalAsInt() \
+                        and node.parm(plane_parm_names.label).evalAsString()\
+                        and node.parm(plane_parm_names.separate).evalAsInt():
                         path = parm.evalAsString()
                         sgtk.util.register_publish(self._app.sgtk, self._app.context, path, node.name(), published_file_type="Rendered Image AOV", version_number=version, dependency_paths=[backup_path], created_by=self._app.context.user)
 
@@ -634,8 +721,8 @@ class TkArnoldNodeHandler(object):
         work_file_fields = self._get_hipfile_fields(node)
 
         output_profile = self._get_output_profile(node)
-        output_cache_template = self._app.get_template_by_name(
-            output_profile["output_render_template"])
+        output_cache_template = self._get_output_profile_template(
+            output_profile, "output_render_template")
 
         # create fields dict with all the metadata
         fields = {
@@ -686,9 +773,10 @@ class TkArnoldNodeHandler(object):
             path = "ERROR: %s" % (err,)
 
         # Unlock, set, lock
-        node.parm(parm_name).lock(False)
-        node.parm(parm_name).set(path)
-        node.parm(parm_name).lock(True)
+        parm = node.parm(parm_name)
+        parm.lock(False)
+        parm.set(path)
+        parm.lock(True)
 
 
     # compute the output path based on the current work file and backup template
@@ -701,8 +789,8 @@ class TkArnoldNodeHandler(object):
             raise sgtk.TankError(msg)
 
         output_profile = self._get_output_profile(node)
-        output_cache_template = self._app.get_template_by_name(
-                        output_profile["output_backup_render_template"])
+        output_cache_template = self._get_output_profile_template(
+            output_profile, "output_backup_render_template")
 
         # create fields dict with all the metadata
         fields = {
@@ -740,8 +828,8 @@ class TkArnoldNodeHandler(object):
         output_profile = self._get_output_profile(node)
 
         # Get the render template from the app
-        output_template = self._app.get_template_by_name(
-            output_profile[template_name])
+        output_template = self._get_output_profile_template(
+            output_profile, template_name)
 
         # create fields dict with all the metadata
         fields = {
@@ -778,23 +866,40 @@ class TkArnoldNodeHandler(object):
         if not node:
             node = hou.pwd()
 
-        output_profile_parm = node.parm(self.TK_OUTPUT_PROFILE_PARM)
-        output_profile_name = \
-            output_profile_parm.menuLabels()[output_profile_parm.eval()]
-        return self._output_profiles[output_profile_name]
+        output_profile_index = node.parm(self.TK_OUTPUT_PROFILE_PARM).eval()
+        return self._output_profiles_by_index[output_profile_index]
+
+
+    def _get_output_profile_template(self, output_profile, template_name):
+        """Get a template of the supplied output profile.
+
+        :param dict output_profile: The output profile.
+        :param str template_name: The profile setting naming the template.
+
+        """
+
+        return self._output_profile_templates[output_profile["name"]][
+            template_name]
 
 
     def _get_hipfile_fields(self, node):
         """Extract fields from current Houdini file using workfile template."""
 
         current_file_path = hou.hipFile.path() # NB could be the work file or the render backup file
+        output_profile = self._get_output_profile(node)
+
+        # the fields only change with the hip path and the output profile, so
+        # reuse the previous result when neither has changed.
+        cache_key = (current_file_path, output_profile["name"])
+        (cached_key, cached_fields) = self._hipfile_fields_cache
+        if cache_key == cached_key:
+            return cached_fields
 
         work_fields = {}
-        work_file_template = self._app.get_template("work_file_template")
+        work_file_template = self._app.get_work_file_template()
 
-        output_profile = self._get_output_profile(node)
-        render_backup_file_template = self._app.get_template_by_name(
-                        output_profile["output_backup_render_template"])
+        render_backup_file_template = self._get_output_profile_template(
+            output_profile, "output_backup_render_template")
 
         if (work_file_template and 
             work_file_template.validate(current_file_path)):
@@ -805,6 +910,7 @@ class TkArnoldNodeHandler(object):
             render_backup_file_template.validate(current_file_path)):
             work_fields = render_backup_file_template.get_fields(current_file_path)
 
+        self._hipfile_fields_cache = (cache_key, work_fields)
         return work_fields
 
 
@@ -830,8 +936,8 @@ class TkArnoldNodeHandler(object):
         output_profile = self._get_output_profile(node)
 
         # get the output cache template for the current profile
-        output_render_template = self._app.get_template_by_name(
-            output_profile["output_render_template"])
+        output_render_template = self._get_output_profile_template(
+            output_profile, "output_render_template")
 
         if not output_render_template.validate(file_name):
             msg = ("Unable to validate files on disk for node %s."
@@ -873,23 +979,29 @@ def _copy_inputs(source_node, target_node):
             connection.inputNode())
 
 
-def _copy_parm_values(source_node, target_node, excludes=None):
+def _copy_parm_values(source_node, target_node, excludes=None,
+                      exclude_predicate=None):
     """Copy matching parameter values from source node to target node.
 
     :param hou.Node source_node: Soure node with parm values to copy.
     :param hou.Node target_node: Target node to receive the copied parm values.
     :parm list excludes: List of parm names to exclude during copy.
+    :param callable exclude_predicate: Optional callable taking a parm name
+        and returning True if that parm should be excluded during copy.
 
     """
 
-    if not excludes:
-        excludes = []
+    # hashed lookups, since ROPs can have hundreds of parms
+    excludes = frozenset(excludes) if excludes else frozenset()
 
-    # build a parameter list from the source node, ignoring the excludes
-    source_parms = [
-        parm for parm in source_node.parms() if parm.name() not in excludes]
+    for source_parm in source_node.parms():
 
-    for source_parm in source_parms:
+        # skip the excluded parms
+        source_parm_name = source_parm.name()
+        if source_parm_name in excludes:
+            continue
+        if exclude_predicate and exclude_predicate(source_parm_name):
+            continue
 
         source_parm_template = source_parm.parmTemplate()
 
@@ -897,15 +1009,16 @@ def _copy_parm_values(source_node, target_node, excludes=None):
         if isinstance(source_parm_template, hou.FolderSetParmTemplate):
             continue
 
-        target_parm = target_node.parm(source_parm.name())
+        target_parm = target_node.parm(source_parm_name)
 
         # if the parm on the target node doesn't exist, skip it
         if target_parm is None:
             continue
 
         # if we have keys/expressions we need to copy them all.
-        if source_parm.keyframes():
-            for key in source_parm.keyframes():
+        keyframes = source_parm.keyframes()
+        if keyframes:
+            for key in keyframes:
                 target_parm.setKeyframe(key)
         else:
             # if the parameter is a string, copy the raw string.
@@ -929,14 +1042,59 @@ def _copy_parm_values(source_node, target_node, excludes=None):
                     else:
                         raise
 
-def _get_extra_plane_numbers(node):
-    """Return a list of aov plane nubmers.
-    
+def _get_plane_parm_names(plane_number):
+    """Return the names of the parms belonging to an aov plane.
+
+    :param int plane_number: The number of the aov plane.
+
+    :rtype: _PlaneParmNames
+
+    The names are built once per plane number and cached.
+
+    """
+
+    parm_names = _PLANE_PARM_NAMES.get(plane_number)
+    if parm_names is None:
+        template_mapping = tuple(
+            (parm_name.replace("#", str(plane_number)), template_name)
+            for (parm_name, template_name) in
+            TkArnoldNodeHandler.TK_EXTRA_PLANE_TEMPLATE_MAPPING.items()
+        )
+        parm_names = _PlaneParmNames(
+            label=TkArnoldNodeHandler.TK_EXTRA_PLANES_NAME % (plane_number,),
+            enable="ar_enable_aov%s" % (plane_number,),
+            separate="ar_aov_separate%s" % (plane_number,),
+            separate_file="sgtk_ar_aov_separate_file%s" % (plane_number,),
+            ar_separate_file="ar_aov_separate_file%s" % (plane_number,),
+            template_mapping=template_mapping,
+        )
+        _PLANE_PARM_NAMES[plane_number] = parm_names
+    return parm_names
+
+
+def _get_extra_plane_count(node):
+    """Return the number of aov planes.
+
     :param hou.Node node: The node being acted upon.
-    
+
     """
 
-    return range(1, node.parm(TkArnoldNodeHandler.TK_EXTRA_PLANE_COUNT_PARM).eval() + 1)
+    return node.parm(TkArnoldNodeHandler.TK_EXTRA_PLANE_COUNT_PARM).eval()
+
+
+def _iter_extra_plane_numbers(plane_count):
+    """Return an iterable of aov plane numbers.
+
+    :param int plane_count: The number of aov planes, as returned by
+        _get_extra_plane_count.
+
+    """
+
+    # most nodes don't have any extra planes
+    if not plane_count:
+        return ()
+
+    return _range(1, plane_count + 1)
 
 
 def _move_outputs(source_node, target_node):
@@ -950,5 +1108,3 @@ def _move_outputs(source_node, target_node):
     for connection in source_node.outputConnections():
         output_node = connection.outputNode()
         output_node.setInput(connection.inputIndex(), target_node)
-
-